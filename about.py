@@ -6,6 +6,7 @@ Last updated: 28 December 2025
 """
 
 import streamlit as st
+from utils.content import render_page_links, render_sections
 
 
 # =============================================================================
@@ -63,29 +64,11 @@ with belief3:
 		)
 
 
-st.header("What it helps you improve")
-with st.container(border=True):
-	st.markdown(
-		"- **Consistency:** you follow through more often\n"
-		"- **Self-awareness:** you understand what works for you\n"
-		"- **Focus:** you reduce distractions and decision fatigue\n"
-		"- **Confidence:** progress becomes visible and repeatable"
-	)
-
-
-st.header("How it’s built")
-with st.container(border=True):
-	st.write(
-		"DayMark is built with Streamlit for the interface and Firebase for authentication and storage. "
-		"Your account is tied to your email, and your data is stored securely per user and per month."
-	)
-	st.markdown(
-		"- **Frontend:** Streamlit (Python)\n"
-		"- **Authentication:** Firebase Auth\n"
-		"- **Database:** Cloud Firestore\n"
-		"- **Hosting:** Streamlit Cloud"
-	)
-	st.caption("DayMark is a proprietary application. Source code is not publicly available.")
+render_sections([
+	("What it helps you improve", "about/improve", None),
+	("How it’s built", "about/built",
+		("caption", "DayMark is a proprietary application. Source code is not publicly available.")),
+])
 
 
 # =============================================================================
@@ -114,13 +97,6 @@ with st.container(border=True):
 st.divider()
 st.header("Next")
 
-cta1, cta2 = st.columns(2)
-with cta1:
-	if st.button("Open DayMark", width='stretch'):
-		st.switch_page("main.py")
-
-with cta2:
-	if st.button("How it works", width='stretch'):
-		st.switch_page("how_it_works.py")
+render_page_links([("Open DayMark", "main.py"), ("How it works", "how_it_works.py")])
 
 st.caption(f"Version {VERSION} · Last updated: {LAST_UPDATED}")
@@ -8,6 +8,7 @@ Last updated: 28 December 2025
 
 import os
 import streamlit as st
+from utils.content import load_markdown, render_card_grid, render_page_links, render_sections
 
 
 
@@ -17,7 +18,30 @@ import streamlit as st
 VERSION = "1.0.1"
 LAST_UPDATED = "28 December 2025"
 
-
+HERO_IMAGE = "assets/daymark_hero.png"
+INTRO_VIDEO = "assets/daymark_intro.mp4"
+
+# Static copy lives in content/intro/ (read once, then served from cache)
+# Card grids: one list of cards per column
+FEATURE_CARDS = [
+    ["intro/progress", "intro/journal"],
+    ["intro/patterns", "intro/tasks"],
+]
+PHILOSOPHY_CARDS = [["intro/awareness"], ["intro/private"], ["intro/small_steps"]]
+
+# (question, answer file)
+FAQ = [
+    ("🔒 Is my data private?", "intro/faq/private"),
+    ("📤 Can I export my data?", "intro/faq/export"),
+    ("😅 What happens if I miss a day?", "intro/faq/missed_day"),
+    ("🗑️ How do I delete my account?", "intro/faq/delete_account"),
+    ("💾 How does saving work?", "intro/faq/saving"),
+    ("📱 Does DayMark work on mobile?", "intro/faq/mobile"),
+    ("📅 Why can't I select certain dates?", "intro/faq/dates"),
+]
+
+
+@st.cache_data(ttl=300, show_spinner=False)  # Shared by all visitors; refreshed every 5 minutes
 def get_user_count() -> str:
     """Get user count from secrets, or return default text."""
     try:
@@ -29,14 +53,20 @@ def get_user_count() -> str:
     return "Join users building better habits"
 
 
+@st.cache_data(ttl=3600)  # Assets only change on deploy
+def asset_exists(path: str) -> bool:
+    """Check whether an optional asset file exists (cached across reruns)."""
+    return os.path.exists(path)
+
+
 def show_optional_media() -> None:
     """Show optional hero image/video if files exist."""
-    if os.path.exists("assets/daymark_hero.png"):
-        st.image("assets/daymark_hero.png", caption="DayMark - Your private habit tracker")
+    if asset_exists(HERO_IMAGE):
+        st.image(HERO_IMAGE, caption="DayMark - Your private habit tracker")
     
-    if os.path.exists("assets/daymark_intro.mp4"):
+    if asset_exists(INTRO_VIDEO):
         st.subheader("Quick tour")
-        st.video("assets/daymark_intro.mp4")
+        st.video(INTRO_VIDEO)
 
 
 # =============================================================================
@@ -83,56 +113,7 @@ st.divider()
 
 st.header("What you can do with DayMark")
 
-col1, col2 = st.columns(2)
-with col1:
-    with st.container(border=True):
-        st.subheader("📊 See your progress at a glance")
-        st.write(
-            "Track habits in a clean monthly grid. Each habit is a row, each day is a column — "
-            "so you can spot patterns instantly and know exactly where you stand."
-        )
-        st.markdown(
-            "- Add or remove habits anytime\n"
-            "- Check off completed days with one click\n"
-            "- No streak anxiety — just honest visibility"
-        )
-
-    with st.container(border=True):
-        st.subheader("✍️ Capture your thoughts in seconds")
-        st.write(
-            "Write quick daily reflections that help you understand yourself better. "
-            "Set custom prompts in Settings to guide your journaling."
-        )
-        st.markdown(
-            "- One focused entry per day\n"
-            "- Optional guided prompts\n"
-            "- Edit past entries anytime"
-        )
-
-with col2:
-    with st.container(border=True):
-        st.subheader("📈 Understand your patterns")
-        st.write(
-            "Simple charts show your progress without overwhelm: daily scores, "
-            "consistency rankings, and habit trends over time."
-        )
-        st.markdown(
-            "- Daily score: see your productive days\n"
-            "- Consistency: find your strongest habits\n"
-            "- Trends: compare habits side by side"
-        )
-
-    with st.container(border=True, height='stretch'):
-        st.subheader("✅ Stay on top of daily tasks")
-        st.write(
-            "Keep simple to-do lists for each day. A lightweight task manager that "
-            "helps you take action without getting in the way."
-        )
-        st.markdown(
-            "- Add tasks for any day\n"
-            "- Check them off as you finish\n"
-            "- Track completion progress"
-        )
+render_card_grid(FEATURE_CARDS)
 
 
 st.divider()
@@ -144,84 +125,29 @@ st.divider()
 
 st.header("Philosophy")
 
-p1, p2, p3 = st.columns(3)
-with p1:
-    with st.container(border=True, height='stretch'):
-        st.subheader("Awareness over streaks")
-        st.write(
-            "Streaks can motivate — but they can also create guilt. DayMark focuses on "
-            "showing your reality so you can improve calmly."
-        )
-
-with p2:
-    with st.container(border=True, height='stretch'):
-        st.subheader("Private by design")
-        st.write(
-            "No social feed. No public profile. No comparison. Your habits and journal are "
-            "for you — not an audience."
-        )
-
-with p3:
-    with st.container(border=True, height='stretch'):
-        st.subheader("Small steps, long-term change")
-        st.write(
-            "When you can see your patterns, you can change them. DayMark is built to support "
-            "tiny daily wins that compound over time."
-        )
+render_card_grid(PHILOSOPHY_CARDS)
 
 
 st.header("Purpose")
-st.write(
-    "DayMark helps you build a life you actually like living — by making it easier to "
-    "keep promises to yourself. Over time, this can improve your:"
-)
-st.markdown(
-    "- Consistency (you do what you said you’d do)\n"
-    "- Self-awareness (you understand what works for you)\n"
-    "- Confidence (progress becomes visible)\n"
-    "- Focus (fewer distractions, clearer routines)"
-)
+st.markdown(load_markdown("intro/purpose"))
 
 
 st.divider()
 
 
 # -----------------------------------------------------------------------------
-# How it works (simple, beginner-friendly)
+# How it works (simple, beginner-friendly) & privacy promise
 # -----------------------------------------------------------------------------
 
-st.header("How it works")
-with st.container(border=True):
-    st.markdown(
-        "**1) Create an account or log in**\n"
-        "Your email/password is used only for authentication.\n\n"
-        "**2) Pick a date**\n"
-        "The date controls what month/day you’re viewing (habits, journal, tasks).\n\n"
-        "**3) Track habits and write a journal entry**\n"
-        "Check off what you completed and add a short reflection if you want.\n\n"
-        "**4) Save changes**\n"
-        "DayMark uses manual saving to avoid accidental writes. Click **Save Changes** before closing or refreshing."
-    )
-
+render_sections([
+    ("How it works", "intro/how_it_works", None),
+])
 
 st.divider()
 
-
-# -----------------------------------------------------------------------------
-# Privacy promise
-# -----------------------------------------------------------------------------
-
-st.header("Privacy")
-with st.container(border=True):
-    st.write(
-        "Your data is yours. DayMark stores only what it needs to function: your habits, journal entries, "
-        "tasks, and settings. There’s no social layer and no public sharing."
-    )
-    st.markdown(
-        "- No feed, no followers, no leaderboard\n"
-        "- Your journal is private to your account\n"
-        "- Analytics are computed from your own data"
-    )
+render_sections([
+    ("Privacy", "intro/privacy", None),
+])
 
 
 st.divider()
@@ -233,14 +159,7 @@ st.divider()
 
 st.header("Get started")
 
-cta1, cta2 = st.columns(2)
-with cta1:
-    if st.button("🔐 Log in / Sign up", width='stretch'):
-        st.switch_page("main.py")
-
-with cta2:
-    if st.button("About DayMark", width='stretch'):
-        st.switch_page("about.py")
+render_page_links([("🔐 Log in / Sign up", "main.py"), ("About DayMark", "about.py")])
 
 
 st.caption(
@@ -255,67 +174,20 @@ st.caption(
 st.divider()
 st.header("Frequently Asked Questions")
 
-with st.expander("🔒 Is my data private?"):
-    st.write(
-        "Yes, completely. DayMark has no social features, no public profiles, and no data sharing. "
-        "Your habits, journal entries, and tasks are visible only to you. We use Firebase for "
-        "secure authentication and storage."
-    )
-
-with st.expander("📤 Can I export my data?"):
-    st.write(
-        "Data export is not yet available in the app, but we're working on it. "
-        "If you need your data urgently, contact us and we'll help you get it."
-    )
-
-with st.expander("😅 What happens if I miss a day?"):
-    st.write(
-        "Nothing bad! DayMark doesn't punish you for missing days. There are no streaks to break, "
-        "no notifications to guilt you. Just pick up where you left off. Missing a day is feedback, "
-        "not failure."
-    )
-
-with st.expander("🗑️ How do I delete my account?"):
-    st.write(
-        "To delete your account and all associated data, contact us via Instagram (@tahsin_2155) "
-        "or email (tahsindlg@gmail.com). We'll process your request promptly."
-    )
-
-with st.expander("💾 How does saving work?"):
-    st.write(
-        "DayMark auto-saves about every 1–1.5 minutes while you're using the app. "
-        "Logging out also saves your data. However, we recommend clicking **Save Changes** "
-        "after important edits to be safe."
-    )
-
-with st.expander("📱 Does DayMark work on mobile?"):
-    st.write(
-        "Yes! DayMark works in any modern browser on desktop, tablet, or mobile. "
-        "The interface adapts to your screen size."
-    )
-
-with st.expander("📅 Why can't I select certain dates?"):
-    st.write(
-        "DayMark limits date selection for a reason: you can only view dates **from your account creation date up to today**. "
-        "Future dates are disabled because you can't complete habits or write reflections for days that haven't happened yet. "
-        "Dates before your account was created are also unavailable since there's no data to show."
-    )
+for question, answer in FAQ:
+    with st.expander(question):
+        st.markdown(load_markdown(answer))
 
 
 # =============================================================================
 # Footer
 # =============================================================================
 st.divider()
-footer1, footer2, footer3 = st.columns(3)
-with footer1:
-    if st.button("About", width='stretch'):
-        st.switch_page("about.py")
-with footer2:
-    if st.button("Privacy", width='stretch'):
-        st.switch_page("privacy_policy.py")
-with footer3:
-    if st.button("Terms", width='stretch'):
-        st.switch_page("terms_of_use.py")
+render_page_links([
+    ("About", "about.py"),
+    ("Privacy", "privacy_policy.py"),
+    ("Terms", "terms_of_use.py"),
+])
 
 st.caption(f"Version {VERSION} · Last updated: {LAST_UPDATED}")
 
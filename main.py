@@ -1,148 +1,3 @@
-import streamlit as st
-from datetime import datetime
-from zoneinfo import ZoneInfo
-import time
-
-
-# -------------------------------
-# Page config
-# -------------------------------
-st.set_page_config(
-    page_title="DayMark"
-)
-
-
-# -------------------------------
-# IST timezone (server-enforced)
-# -------------------------------
-IST = ZoneInfo(st.context.timezone)
-
-TARGET_TIME_IST = datetime(2025, 1, 1, 0, 0, 0, tzinfo=IST)
-now_ist = datetime.now(IST)
-
-
-# ============================================================
-# BEFORE LAUNCH — apply ALL custom CSS + landing UI
-# ============================================================
-if now_ist < TARGET_TIME_IST:
-
-    # ---------- Scoped CSS ----------
-    st.markdown("""
-    <style>
-        .block-container {
-            padding-top: 4rem;
-            padding-bottom: 4rem;
-        }
-
-        /* HEADINGS */
-        h1 {
-            text-align: center;
-            font-size: 3rem;
-            font-weight: 700;
-            margin-bottom: 0.5rem;
-        }
-
-        .subtitle {
-            text-align: center;
-            opacity: 0.7;
-            margin-bottom: 3rem;
-            font-size: 1.05rem;
-        }
-
-        /* FLEX CONTAINER UPDATES */
-        .countdown-container {
-            display: flex;
-            justify-content: center;
-            flex-wrap: wrap; 
-            gap: 2rem;
-            margin: 0 auto;
-        }
-
-        /* BOX STYLING */
-        .countdown-box {
-            border-radius: 18px;
-            padding: 1.75rem 2rem;
-            min-width: 120px;
-            text-align: center;
-            
-            /* Subtle border for definition in both themes */
-            border: 1px solid rgba(128, 128, 128, 0.2);
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-            
-            flex: 1 1 150px; 
-            max-width: 200px;
-        }
-
-        /* NUMBERS: UPDATED TO MATCH THEME TEXT */
-        .countdown-number {
-            font-size: 2.75rem;
-            font-weight: 700;
-            line-height: 1;
-        }
-
-        .countdown-label {
-            margin-top: 0.5rem;
-            font-size: 0.9rem;
-            letter-spacing: 0.1em;
-            text-transform: uppercase;
-            opacity: 0.6;
-        }
-
-        /* MOBILE RESPONSIVE TWEAKS */
-        @media (max-width: 600px) {
-            h1 { font-size: 2rem; }
-            .countdown-container { gap: 1rem; }
-            .countdown-box { padding: 1rem; min-width: 130px; }
-            .countdown-number { font-size: 2rem; }
-        }
-    </style>
-    """, unsafe_allow_html=True)
-
-    # ---------- Countdown Logic ----------
-    remaining = TARGET_TIME_IST - now_ist
-    placeholder = st.empty()
-
-    days = remaining.days
-    hours, rem = divmod(remaining.seconds, 3600)
-    minutes, seconds = divmod(rem, 60)
-
-    with placeholder.container():
-        st.markdown("<h1>DayMark</h1>", unsafe_allow_html=True)
-        st.markdown(
-            "<div class='subtitle'>Launching on 1 January 2026</div>",
-            unsafe_allow_html=True
-        )
-
-        st.markdown(f"""
-        <div class="countdown-container">
-            <div class="countdown-box">
-                <div class="countdown-number">{days}</div>
-                <div class="countdown-label">Days</div>
-            </div>
-            <div class="countdown-box">
-                <div class="countdown-number">{hours:02d}</div>
-                <div class="countdown-label">Hours</div>
-            </div>
-            <div class="countdown-box">
-                <div class="countdown-number">{minutes:02d}</div>
-                <div class="countdown-label">Minutes</div>
-            </div>
-            <div class="countdown-box">
-                <div class="countdown-number">{seconds:02d}</div>
-                <div class="countdown-label">Seconds</div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        st.divider()
-        if st.button('Introduction To DayMark', width='stretch', type='primary', key='intro_button'):
-            st.switch_page('intro.py')
-
-    time.sleep(1)
-    st.rerun()
-
-
-
 # ============================================================================
 # DAYMARK - Habit Tracker & Journal App
 # ============================================================================
@@ -166,24 +21,19 @@ if now_ist < TARGET_TIME_IST:
 # ============================================================================
 
 import streamlit as st
-import datetime, copy, time
-import pandas as pd
+import calendar, datetime, time
 from zoneinfo import ZoneInfo
-from utils import db, graphs
+from utils import db
 from utils.auth import show_auth_page
 
 # App timezone
 IST = ZoneInfo(st.context.timezone)
 
-
-# ============================================================================
-# PAGE CONFIGURATION
-# ============================================================================
-# This MUST be the first Streamlit command in the app.
-# It sets the browser tab title, icon, and layout style.
-st.set_page_config(
-    page_title="DayMark",
-    layout="wide"
+# Reminder shown under the header (the privacy line is kept for later use)
+AUTOSAVE_INFO = (
+    '**Auto-save**: DayMark saves automatically every 1–1.5 minutes and when you log out.\n\n'
+    'Still, click Save Changes after important edits.'
+    # 'Privacy: only you can see your habits, journal entries, and tasks.'
 )
 
 
@@ -196,9 +46,8 @@ st.set_page_config(
 #   - settings: User preferences like name, email, reflection prompts
 #   - data: The habits, journal entries, and tasks for the current month
 
-# Check if 'user' exists in session state. If not, set it to None (not logged in)
-if "user" not in st.session_state:
-    st.session_state.user = None
+# If 'user' isn't in session state yet, set it to None (not logged in)
+st.session_state.setdefault("user", None)
 
 
 # ============================================================================
@@ -215,6 +64,22 @@ if not st.session_state.user:
     show_auth_page()
 
 
+# ============================================================================
+# PAGE CONFIGURATION
+# ============================================================================
+# The tab title and icon come from the st.Page / st.set_page_config in
+# streamlit_app.py; this page only needs the wider layout for the habit grid.
+# Set after login, since the login form uses the centered layout (and a
+# successful login continues straight into the dashboard in the same run).
+st.set_page_config(layout="wide")
+
+# The dashboard's heavy libraries are imported only once someone is logged in,
+# so the login screen doesn't wait for pandas and Plotly (pulled in by graphs).
+# Python keeps them in sys.modules, so later reruns don't import them again.
+import pandas as pd
+from utils import graphs
+
+
 # ============================================================================
 # MAIN APP - DATA INITIALIZATION
 # ============================================================================
@@ -222,24 +87,30 @@ if not st.session_state.user:
 # Now we set up the data structures to hold their habits, journal, and tasks.
 
 # Initialize the data storage if it doesn't exist yet
-# This runs only once when the user first logs in
-if "data" not in st.session_state:
-    st.session_state.data = {
-        # habits: Dictionary where keys are habit names, values are dicts of day->boolean
-        # Example: {"Exercise": {"1": True, "2": False, "3": True, ...}}
-        "habits": {},
-        
-        # journal: Dictionary where keys are day numbers, values are the journal text
-        # Example: {"1": "Today was great!", "2": "Feeling tired..."}
-        "journal": {},
-        
-        # tasks: Dictionary where keys are day numbers, values are dicts of task->boolean
-        # Example: {"1": {"Buy groceries": True, "Call mom": False}}
-        "tasks": {},
-        
-        # month_key: Tracks which month we're currently viewing (format: "YYYY-MM")
-        "month_key": None
-    }
+# (setdefault only stores it the first time, right after the user logs in)
+st.session_state.setdefault("data", {
+    # habits: Dictionary where keys are habit names, values are dicts of day->boolean
+    # Example: {"Exercise": {"1": True, "2": False, "3": True, ...}}
+    "habits": {},
+    
+    # journal: Dictionary where keys are day numbers, values are the journal text
+    # Example: {"1": "Today was great!", "2": "Feeling tired..."}
+    "journal": {},
+    
+    # tasks: Dictionary where keys are day numbers, values are dicts of task->boolean
+    # Example: {"1": {"Buy groceries": True, "Call mom": False}}
+    "tasks": {},
+    
+    # month_key: Tracks which month we're currently viewing (format: "YYYY-MM")
+    "month_key": None
+})
+
+# The account creation date is stored as a "YYYY-MM-DD" string.
+# Parse it once per session instead of on every rerun.
+if "account_created" not in st.session_state:
+    st.session_state.account_created = datetime.date.fromisoformat(
+        st.session_state.settings['date_of_account_creation']
+    )
 
 st.title("DayMark")
 
@@ -255,49 +126,137 @@ st.title("DayMark")
 # Create 3 columns for the header layout (5:2:2 ratio)
 hcol1, hcol2, hcol3 = st.columns([5, 2, 2])
 
+# Today's date in the app timezone (looked up once per rerun)
+today = datetime.datetime.now(tz=IST).date()
+
 # Date picker - user can select any date from account creation to today
 # This determines which month's data we load and which day's journal we show
 selected_date = hcol1.date_input(
     "Select Date",
-    datetime.datetime.now(tz=IST),
-    max_value=datetime.datetime.now(tz=IST),  # Can't select future dates
-    min_value=st.session_state.settings['date_of_account_creation'],
+    today,
+    max_value=today,  # Can't select future dates
+    min_value=st.session_state.account_created,
     label_visibility='collapsed' # Hide the label for cleaner look
 )
 
 # Extract the month ("YYYY-MM") and day ("DD") from the selected date
 # month_key groups all data by month, day_key is for journal/tasks
-current_month_key = selected_date.strftime("%Y-%m")  # e.g., "2025-12"
-day_key = selected_date.strftime("%d")               # e.g., "21"
+current_month_key = f"{selected_date.year}-{selected_date.month:02d}"  # e.g., "2025-12"
+day_key = f"{selected_date.day:02d}"                                   # e.g., "21"
 
 # Get the user's unique ID from Firebase (used for database paths)
 user_id = st.session_state.user['localId']
 
-if "savedchanges" not in st.session_state:
-    st.session_state.savedchanges = copy.deepcopy(st.session_state.data)
+# ----------------------------------------
+# Change Detection
+# ----------------------------------------
+# Every widget that edits habits, journal entries, or tasks calls mark_dirty()
+# with the field it changed (a habit name, or a day for journal/tasks).
+# Saving only sends those fields, and only happens when something is pending.
+def no_pending_changes():
+    """Return an empty record of changed fields for each month document."""
+    return {"habits": set(), "journal": set(), "tasks": set()}
 
-if "last_autosave" not in st.session_state:
-    # Initialize so the first autosave doesn't happen immediately.
-    st.session_state.last_autosave = time.time()
+
+def mark_dirty(section, field):
+    """Record that one field of a section ("habits", "journal", "tasks") changed."""
+    st.session_state.pending_changes[section].add(field)
+
+
+def mark_habit_grid_dirty():
+    """on_change for the habit grid: record every habit (row) that was edited."""
+    habit_names = st.session_state.habit_grid_df.index
+    for row in st.session_state.habit_grid["edited_rows"]:
+        mark_dirty("habits", habit_names[row])
+
+
+def has_unsaved_changes():
+    """True if any field has been edited since the last save."""
+    return any(st.session_state.pending_changes.values())
+
+
+st.session_state.setdefault("pending_changes", no_pending_changes())
+
+# Initialize so the first autosave doesn't happen immediately.
+st.session_state.setdefault("last_autosave", time.time())
 
 # ----------------------------------------
-# Save Function
+# Save Functions
 # ----------------------------------------
-# This function saves all current data (habits, journal, tasks) to the database
+# Autosave writes on a background thread so the page doesn't wait for it.
+# Its fields leave pending_changes when it starts; if it fails they are put
+# back so the next save retries them.
+def finish_autosave(wait=False):
+    """Collect the background autosave's result (if it's done, or wait=True)."""
+    job = st.session_state.get("autosave_job")
+    if job is None or not (wait or job["future"].done()):
+        return
+
+    del st.session_state.autosave_job
+    if job["future"].exception() is not None:
+        if job["month_key"] == st.session_state.data["month_key"]:
+            for section, fields in job["fields"].items():
+                st.session_state.pending_changes[section] |= fields
+        st.warning("Autosave failed. Your changes are kept - click **Save Changes** to retry.")
+
+
+def autosave():
+    """Start saving the changed fields in the background."""
+    data = st.session_state.data
+    st.session_state.autosave_job = {
+        "future": db.save_month_changes_in_background(
+            user_id,
+            data["month_key"],
+            data,
+            st.session_state.pending_changes
+        ),
+        "month_key": data["month_key"],
+        "fields": st.session_state.pending_changes,
+    }
+    st.session_state.pending_changes = no_pending_changes()
+    st.session_state.last_autosave = time.time()
+
+
+def autosave_if_due():
+    """
+    Collect a finished autosave and start a new one if it's time.
+    
+    Runs at the end of every full rerun and of every journal fragment rerun
+    (those skip the end of the script), so every kind of edit is autosaved.
+    
+    Returns:
+        bool: True if a new autosave was started
+    """
+    finish_autosave()
+
+    if (
+        (time.time() - st.session_state.last_autosave) >= 60
+        and has_unsaved_changes()
+        and "autosave_job" not in st.session_state
+    ):
+        autosave()
+        return True
+    return False
+
+
+# This function saves the edited habits, journal entries, and tasks to the database
 def save(data=None):
-    """Save all current month's data to Firestore database."""
+    """Save the current month's changed fields to Firestore database."""
     if data is None:
         data = st.session_state.data
 
-    if data != st.session_state.savedchanges:
-        db.save_month_data(
+    # Let a running autosave finish first so writes land in order
+    finish_autosave(wait=True)
+
+    # Skip the database write if nothing changed since the last save
+    if has_unsaved_changes():
+        db.save_month_changes(
             user_id,
-            current_month_key,
-            data["habits"],
-            data["journal"],
-            data["tasks"]
+            data["month_key"],
+            data,
+            st.session_state.pending_changes
         )
-        st.session_state.savedchanges = copy.deepcopy(st.session_state.data)
+        st.session_state.pending_changes = no_pending_changes()
         st.session_state.last_autosave = time.time()
 
 
@@ -316,8 +275,11 @@ def logout():
     
     # Clear all session data to "forget" the user
     st.session_state.pop("habit_grid_df", None)
+    st.session_state.pop("habit_grid_month", None)
+    st.session_state.pop("tasks_df", None)
+    st.session_state.pop("tasks_df_for", None)
     st.session_state.pop("__logout_requested__", None)
-    for key in ("user", "settings", "data"):
+    for key in ("user", "settings", "data", "pending_changes", "account_created", "autosave_job", "last_saved_label"):
         st.session_state.pop(key, None)
 
 
@@ -327,19 +289,18 @@ hcol2.button("Save Changes", width='stretch',type='primary', on_click=save, args
 hcol3.button('Logout', on_click=logout, width='stretch')
 
 if "last_autosave" in st.session_state:
-    # Convert timestamp to IST for display
-    last_save_ist = datetime.datetime.fromtimestamp(
-        st.session_state.last_autosave, tz=IST
-    )
-    st.caption(f"Last saved at {last_save_ist.strftime('%H:%M:%S')}")
+    # Format the save time only when it changes; other reruns reuse the text
+    saved_at, saved_label = st.session_state.get("last_saved_label", (None, ""))
+    if saved_at != st.session_state.last_autosave:
+        saved_at = st.session_state.last_autosave
+        # Convert timestamp to IST for display
+        saved_label = datetime.datetime.fromtimestamp(saved_at, tz=IST).strftime('%H:%M:%S')
+        st.session_state.last_saved_label = (saved_at, saved_label)
+    st.caption(f"Last saved at {saved_label}")
 
 
 # Show a reminder to save before leaving
-st.info(
-'**Auto-save**: DayMark saves automatically every 1–1.5 minutes and when you log out.\n\n'
-'Still, click Save Changes after important edits.'    
-# 'Privacy: only you can see your habits, journal entries, and tasks.'
-)
+st.info(AUTOSAVE_INFO)
 
 
 # ============================================================================
@@ -349,24 +310,30 @@ st.info(
 # 1. Save the current month's data to the database
 # 2. Load the new month's data from the database
 # This ensures data isn't lost when switching months.
+# Both steps run at the same time, so switching costs one round-trip, not two.
 
 # Check if the selected month is different from what we have loaded
 if current_month_key != st.session_state.data["month_key"]:
 
-    # If we had data from a previous month, save it first (only if changed)
-    if st.session_state.data['month_key']:
-        # Only save if data has actually changed (dirty-check)
-        if st.session_state.data != st.session_state.get('savedchanges'):
-            db.save_month_data(
-                user_id,
-                st.session_state.data['month_key'],  # The OLD month
-                st.session_state.data["habits"],
-                st.session_state.data["journal"],
-                st.session_state.data["tasks"]
-            )
+    # Let a running autosave finish first so writes land in order
+    finish_autosave(wait=True)
 
-    # Now load data for the NEW month from the database
-    habits, journals, tasks = db.load_month_data(user_id, current_month_key)
+    # Right after login the month may already be loaded (together with the
+    # settings); there's no old month to save then, so just use it
+    preloaded_key, preloaded_data = st.session_state.pop("preloaded_month", (None, None))
+    if preloaded_key == current_month_key:
+        habits, journals, tasks = preloaded_data
+    else:
+        # Save the OLD month's edited fields (if any) while loading the NEW month
+        habits, journals, tasks = db.switch_month(
+            user_id,
+            st.session_state.data["month_key"],  # The OLD month
+            st.session_state.data,
+            st.session_state.pending_changes,
+            current_month_key
+        )
+    if has_unsaved_changes():
+        st.session_state.last_autosave = time.time()
 
     # Store the loaded data in session state
     st.session_state.data["habits"] = habits
@@ -374,10 +341,21 @@ if current_month_key != st.session_state.data["month_key"]:
     st.session_state.data["tasks"] = tasks
     st.session_state.data["month_key"] = current_month_key  # Remember which month we loaded
 
-    st.session_state.savedchanges = copy.deepcopy(st.session_state.data)
+    st.session_state.pending_changes = no_pending_changes()
+
+    # Warm the cache for the months before and after this one (only months the
+    # date picker allows), so stepping to a neighbouring month is instant
+    month = pd.Period(current_month_key, freq="M")
+    first_month = pd.Period(st.session_state.account_created, freq="M")
+    last_month = pd.Period(today, freq="M")
+    db.prefetch_month_data(
+        user_id,
+        [str(m) for m in (month - 1, month + 1) if first_month <= m <= last_month]
+    )
 
-    # Refresh the page so all widgets show the new data
-    st.rerun()
+    # No rerun needed: the rest of this run already reads the new month's data.
+    # The habit grid rebuilds itself (its stored frame belongs to the old month)
+    # and the journal/task widgets are keyed by month and day.
 
 
 # ============================================================================
@@ -403,6 +381,9 @@ current_task_data = st.session_state.data["tasks"]       # All tasks for this mo
 
 habit, graph, journal, tasks = st.tabs(["Habits", "Analytics", "Journal", "Tasks"])
 
+# Filled in by the Habits tab from the grid it already has (shown in the Journal tab)
+habits_done_today = 0
+
 
 # ============================================================================
 # HABIT TRACKER TAB
@@ -432,11 +413,12 @@ with habit:
                 if st.form_submit_button("Add Habit"):
                     if new_habit_name:  # Make sure they entered a name
                         # Create the new habit with False for every day of the month
-                        # pd.Period gives us how many days are in the current month
-                        days_in_month = pd.Period(current_month_key).days_in_month
+                        # monthrange() gives us how many days are in the selected month
+                        days_in_month = calendar.monthrange(selected_date.year, selected_date.month)[1]
                         current_habit_data[new_habit_name] = {
                             str(d): False for d in range(1, days_in_month + 1)
                         }  # Creates: {"1": False, "2": False, ...}
+                        mark_dirty("habits", new_habit_name)
                         
                         # Delete the cached grid so it rebuilds with the new habit
                         if "habit_grid_df" in st.session_state:
@@ -458,6 +440,7 @@ with habit:
             # Button is disabled if there's nothing to delete
             if st.button("Delete Habit", disabled=bool(not habit_to_delete)):
                 del current_habit_data[habit_to_delete]  # Remove from data
+                mark_dirty("habits", habit_to_delete)
                 
                 # Delete the cached grid so it rebuilds without this habit
                 if "habit_grid_df" in st.session_state:
@@ -476,40 +459,42 @@ with habit:
         st.info("No habits found for this month. Please add some.")
 
     else:
-        # Convert the habits dictionary to a pandas DataFrame for display
-        # .T transposes it so habits are rows and days are columns
-        df = pd.DataFrame(current_habit_data).T
-
-        # Sort columns numerically ("1", "2", "3" ... not "1", "10", "11")
-        day_cols = sorted(df.columns, key=lambda c: int(c))
-        df = df[day_cols]
-
         # Store the DataFrame in session_state so edits persist between reruns
-        # Only create it if it doesn't exist or if we switched months
+        # Only build it if it doesn't exist (adding/deleting a habit removes it)
+        # or if it belongs to a different month - other widgets reuse it as-is
         if (
             "habit_grid_df" not in st.session_state
-            or st.session_state.data["month_key"] != current_month_key
+            or st.session_state.get("habit_grid_month") != current_month_key
         ):
-            st.session_state.habit_grid_df = df.copy()
+            # Convert the habits dictionary to a pandas DataFrame for display
+            # .T transposes it so habits are rows and days are columns
+            df = pd.DataFrame(current_habit_data).T
+
+            # Sort columns numerically ("1", "2", "3" ... not "1", "10", "11")
+            st.session_state.habit_grid_df = df[sorted(df.columns, key=lambda c: int(c))]
+            st.session_state.habit_grid_month = current_month_key
 
         # Display the editable grid - users can click cells to toggle True/False
         edited_df = st.data_editor(
-            st.session_state.habit_grid_df[day_cols],
-            key="habit_grid"
+            st.session_state.habit_grid_df,
+            key="habit_grid",
+            on_change=mark_habit_grid_dirty
         )
 
-        # Make sure columns stay sorted after editing
-        edited_df = edited_df[day_cols]
+        # Count today's completed habits once, for the Journal tab
+        # (habit days are stored without a leading zero: "5", not "05")
+        today_col = str(selected_date.day)
+        if today_col in edited_df.columns:
+            habits_done_today = int(edited_df[today_col].sum())
 
-        # Convert the edited DataFrame back to our dictionary format
-        # This syncs the UI changes to our data structure
-        new_data = {
-            habit: {str(d): bool(edited_df.loc[habit, str(d)]) for d in day_cols}
-            for habit in edited_df.index
-        }
-        # Update the habit data with the new values
-        current_habit_data.clear()
-        current_habit_data.update(new_data)
+        # Sync the UI changes to our data structure by copying over only the
+        # cells the user changed. edited_rows maps row number -> {day: value}
+        # (relative to habit_grid_df), so reruns with no edits do no work here.
+        habit_names = st.session_state.habit_grid_df.index
+        for row, changes in st.session_state.habit_grid["edited_rows"].items():
+            habit_days = current_habit_data[habit_names[row]]
+            for day, value in changes.items():
+                habit_days[day] = bool(value)
 
 
 # ============================================================================
@@ -518,23 +503,9 @@ with habit:
 # The journal tab lets users write daily reflections.
 # Each day has its own journal entry that gets saved separately.
 
-with journal:
-    st.header("Daily Journal")
-
-    # Show which specific day we're journaling for (e.g., "2025-12-21")
-    st.write(f"Viewing: **{current_month_key}-{day_key}**")
-
-    # Calculate and show how many habits were completed today
-    # This gives users context about their day while journaling
-    done = sum(
-        current_habit_data[h].get(day_key, False)  # Count True values
-        for h in current_habit_data
-    )
-    total = len(current_habit_data)  # Total number of habits
-
-    st.markdown(f"**Habits completed:** {done} / {total}")
-    st.progress(done / total if total > 0 else 0)  # Visual progress bar
-
+@st.fragment  # Finishing an edit only reruns the text box, not the whole page
+def render_journal_entry(journal_data, day_key):
+    """Show the journal text box for one day and keep journal_data in sync."""
     # Create a unique key for the text area based on the date
     # This ensures the widget resets properly when the date changes
     text_key = f"journal_{current_month_key}_{day_key}"
@@ -542,8 +513,8 @@ with journal:
     # Load the existing journal entry for this day
     # If there's no entry yet, use the default reflection questions from settings
     existing_text = (
-        current_journal_data.get(day_key, "") 
-        if current_journal_data.get(day_key, "") != "" 
+        journal_data.get(day_key, "") 
+        if journal_data.get(day_key, "") != "" 
         else st.session_state.settings['reflection_questions']
     )
 
@@ -552,13 +523,40 @@ with journal:
         "Write your thoughts...",
         value=existing_text,
         height=400,
-        key=text_key
+        key=text_key,
+        on_change=mark_dirty,
+        args=("journal", day_key)
     )
 
     # If the text changed, save it to our data (in memory only)
     # The database save happens when the user clicks "Save Changes"
     if new_text != existing_text:
-        current_journal_data[day_key] = new_text
+        journal_data[day_key] = new_text
+
+    # A fragment rerun never reaches the autosave at the end of the script,
+    # so check it here too. When a save starts, rerun the whole page once so
+    # the "Last saved at" time above is updated.
+    if autosave_if_due():
+        st.rerun()
+
+
+with journal:
+    st.header("Daily Journal")
+
+    # Show which specific day we're journaling for (e.g., "2025-12-21")
+    st.write(f"Viewing: **{current_month_key}-{day_key}**")
+
+    # Calculate and show how many habits were completed today
+    # This gives users context about their day while journaling
+    done = habits_done_today         # Counted by the Habits tab above
+    total = len(current_habit_data)  # Total number of habits
+
+    st.markdown(f"**Habits completed:** {done} / {total}")
+    st.progress(done / total if total > 0 else 0)  # Visual progress bar
+
+    # st.text_area only reruns the script when the user clicks away (or presses
+    # Ctrl+Enter), not per keystroke. That rerun is scoped to this fragment.
+    render_journal_entry(current_journal_data, day_key)
 
 
 # ============================================================================
@@ -593,6 +591,7 @@ with tasks:
                         if new_task_name:
                             task_today[new_task_name] = False  # New tasks start unchecked
                             current_task_data[day_key] = task_today  # Save to data
+                            mark_dirty("tasks", day_key)
                             st.success(f'Added task: {new_task_name}')
                             st.rerun()
                         else:
@@ -609,25 +608,48 @@ with tasks:
                     if task_to_remove in task_today:
                         del task_today[task_to_remove]
                         current_task_data[day_key] = task_today
+                        mark_dirty("tasks", day_key)
                         st.success(f'Removed task: {task_to_remove}')
                         st.rerun()
 
-        # Display each task as a checkbox
-        for task, completed in task_today.items():
-            task_today[task] = st.checkbox(
-                task,
-                value=completed,
-                key=f"{day_key}_{task}"  # Unique key per day per task
+        # Display all of today's tasks in one editable table with a checkbox column
+        # (one widget for the whole list instead of one checkbox per task)
+        if task_today:
+            # Like the habit grid, the table's DataFrame is kept in session_state.
+            # The editor resets its edits whenever its data changes, so the frame
+            # is only rebuilt for another day or after a task is added/removed.
+            tasks_for = (current_month_key, day_key, list(task_today))
+            if st.session_state.get("tasks_df_for") != tasks_for:
+                st.session_state.tasks_df = pd.DataFrame(
+                    {"Task": list(task_today), "Done": list(task_today.values())}
+                )
+                st.session_state.tasks_df_for = tasks_for
+
+            tasks_key = f"tasks_{current_month_key}_{day_key}"  # Unique key per day
+            st.data_editor(
+                st.session_state.tasks_df,
+                hide_index=True,
+                disabled=["Task"],  # Only the checkboxes can be edited here
+                width='stretch',
+                key=tasks_key,
+                on_change=mark_dirty,
+                args=("tasks", day_key)
             )
+
+            # Copy the ticked/unticked boxes into today's tasks (rows follow the frame)
+            task_names = st.session_state.tasks_df["Task"]
+            for row, changes in st.session_state[tasks_key]["edited_rows"].items():
+                if "Done" in changes:
+                    task_today[task_names[row]] = bool(changes["Done"])
         
     # --- PROGRESS DISPLAY ---
     with progress.container(border=True, height='stretch'):
         st.header("Task Completion Progress")
         st.write("Track your task completion progress for the day.")
         
-        # Count how many tasks are done
-        value = sum(1 for v in current_task_data.get(day_key, {}).values() if v)
-        total = len(current_task_data.get(day_key, {}))
+        # Count how many tasks are done (task_today already holds this day's tasks)
+        value = sum(task_today.values())  # True counts as 1
+        total = len(task_today)
         
         # Show a progress bar
         st.progress(
@@ -645,17 +667,40 @@ with tasks:
 # 2. Individual Trends - Track specific habits over time
 # 3. Habit Consistency - Which habits are you best at? (bar chart)
 
-with graph:
+@st.fragment  # Picking habits only reruns this chart, not the rest of the tab
+def render_habit_trends(habit_data):
+    """Show a habit picker and the trend chart for the picked habits."""
+    # One multiselect instead of a checkbox (and column) per habit
+    selected_habits = st.multiselect(
+        "Compare habits",
+        list(habit_data.keys()),
+        placeholder="Choose habits to compare"
+    )
+
+    # Show the trend chart for selected habits
+    st.plotly_chart(graphs.plot_individual_trends(habit_data, selected_habits), width='stretch')
+
+
+@st.fragment  # The charts toggle and habit picker only rerun the Analytics tab
+def render_analytics(habit_data):
+    """Render the Analytics tab: the charts toggle and the three charts."""
     st.header("📊 Analytics & Insights")
     
+    # Tabs can't tell us which one is open, so all of them run on every rerun.
+    # The charts are only built and sent once the user switches them on
+    # (the toggle remembers its state for the rest of the session).
+    show_charts = st.toggle("Show charts", key="show_analytics")
+
     # Can't show charts if there's no data
-    if not current_habit_data:
+    if not habit_data:
         st.info("Add some habits to see analytics!")
+    elif not show_charts:
+        st.caption("Turn on **Show charts** to see your daily score, trends, and consistency.")
     else:
         # --- DAILY SCORE CHART ---
         # Shows a line graph of total habits completed per day
         with st.container(border=True):
-            st.plotly_chart(graphs.calculate_daily_score(current_habit_data), width='stretch')
+            st.plotly_chart(graphs.calculate_daily_score(habit_data), width='stretch')
 
         # Two columns: left for trends, right for consistency
         gcol1, gcol2 = st.columns([5, 2])
@@ -663,21 +708,16 @@ with graph:
         # --- INDIVIDUAL HABIT TRENDS ---
         # Users can select which habits to compare on the chart
         with gcol1.container(border=True):
-            # Create a checkbox for each habit
-            cols = st.columns(len(current_habit_data.keys()))
-            selected_habits = []
-            for col, habit in zip(cols, current_habit_data.keys()):
-                with col:
-                    if st.checkbox(habit, value=False):
-                        selected_habits.append(habit)
-            
-            # Show the trend chart for selected habits
-            st.plotly_chart(graphs.plot_individual_trends(current_habit_data, selected_habits), width='stretch')
+            render_habit_trends(habit_data)
 
         # --- HABIT CONSISTENCY CHART ---
         # Bar chart showing which habits have the most completions
         with gcol2.container(border=True, height='stretch'):
-            st.plotly_chart(graphs.calculate_habit_consistency(current_habit_data), width='stretch')
+            st.plotly_chart(graphs.calculate_habit_consistency(habit_data), width='stretch')
+
+
+with graph:
+    render_analytics(current_habit_data)
 
 
 # ============================================================================
@@ -688,11 +728,7 @@ with graph:
 #
 # We autosave on those reruns (not via forced refresh) roughly every 1–1.5 minutes.
 # This avoids constant writes while still protecting users from accidental loss.
+# The write runs in the background, so it never blocks the UI.
+# (The journal fragment runs the same check after its own reruns.)
 
-now = time.time()
-if (now - st.session_state.last_autosave) >= 60:
-    try:
-        save(st.session_state.data)
-    except Exception:
-        # Autosave should never block the UI.
-        pass
+autosave_if_due()
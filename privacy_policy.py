@@ -6,6 +6,7 @@ Last updated: 28 December 2025
 """
 
 import streamlit as st
+from utils.content import render_page_links
 
 
 # =============================================================================
@@ -125,13 +126,6 @@ with st.container(border=True):
 
 
 st.divider()
-cta1, cta2 = st.columns(2)
-with cta1:
-	if st.button("Back to DayMark", width='stretch'):
-		st.switch_page("main.py")
-
-with cta2:
-	if st.button("Terms of Use", width='stretch'): 
-		st.switch_page("terms_of_use.py")
+render_page_links([("Back to DayMark", "main.py"), ("Terms of Use", "terms_of_use.py")])
 
 st.caption(f"Last updated: {LAST_UPDATED}")
@@ -8,8 +8,6 @@ Last updated: 28 December 2025
 import streamlit as st
 from utils import db
 
-st.set_page_config(page_title="Settings", layout="centered")
-
 
 st.title('Settings')
 st.caption("Personalize DayMark and set optional journal prompts.")
@@ -53,5 +51,4 @@ with st.container(border=True):
 
 
 st.divider()
-if st.button("← Back to DayMark", width='stretch'):
-    st.switch_page("main.py")
\ No newline at end of file
+st.page_link("main.py", label="← Back to DayMark", width='stretch')
\ No newline at end of file
@@ -6,6 +6,7 @@ Last updated: 28 December 2025
 """
 
 import streamlit as st
+from utils.content import render_page_links
 
 
 # =============================================================================
@@ -115,13 +116,6 @@ with st.container(border=True):
 
 
 st.divider()
-cta1, cta2 = st.columns(2)
-with cta1:
-	if st.button('Open DayMark', width='stretch'):
-		st.switch_page("main.py")
-
-with cta2:
-	if st.button("Privacy Policy", width='stretch'):
-		st.switch_page("privacy_policy.py")
+render_page_links([("Open DayMark", "main.py"), ("Privacy Policy", "privacy_policy.py")])
 
 st.caption(f"Last updated: {LAST_UPDATED}")
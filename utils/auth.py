@@ -12,15 +12,19 @@ To integrate this into the main app (streamlit_app.py), you can either:
 FUNCTIONS TO MOVE TO utils/auth.py:
 -----------------------------------
 - send_verification_email()  -> Sends Firebase email verification
-- get_account_info()         -> Retrieves user account details from Firebase
-- is_email_verified()        -> Checks if user's email is verified
+- refresh_id_token()         -> Gets a fresh ID token (with current claims)
+- read_token_claims()        -> Reads claims like email_verified from a token
 
 These functions are Firebase auth-related and belong with login_user/signup_user.
 """
 
+import base64
 import datetime
+import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 import streamlit as st
 from zoneinfo import ZoneInfo
 from utils import db
@@ -35,6 +39,31 @@ IST = ZoneInfo("Asia/Kolkata")  # App timezone
 # Pre-compiled email regex (avoids recompiling on every validation)
 _EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
+# Friendly versions of Firebase's error codes (unknown codes are shown as-is)
+_LOGIN_ERROR_MESSAGES = {
+    "EMAIL_NOT_FOUND": "No account found with this email address",
+    "INVALID_PASSWORD": "Incorrect password",
+    "INVALID_LOGIN_CREDENTIALS": "Invalid email or password",
+    "USER_DISABLED": "This account has been disabled",
+    "TOO_MANY_ATTEMPTS_TRY_LATER": "Too many failed attempts. Please try again later",
+}
+_SIGNUP_ERROR_MESSAGES = {
+    "EMAIL_EXISTS": "An account with this email already exists",
+    "WEAK_PASSWORD": f"Password must be at least {MIN_PASSWORD_LENGTH} characters",
+    "INVALID_EMAIL": "Please enter a valid email address",
+    "OPERATION_NOT_ALLOWED": "Email/password signup is disabled",
+}
+
+# Firebase Auth REST base URL (endpoint action and API key are appended)
+_IDENTITY_TOOLKIT_URL = "https://identitytoolkit.googleapis.com/v1/accounts"
+# Secure Token endpoint (swaps a refresh token for a new ID token)
+_SECURE_TOKEN_URL = "https://securetoken.googleapis.com/v1/token"
+HTTP_TIMEOUT = 10  # Seconds before a Firebase request is abandoned
+
+# Connection pool sizing for the shared session (one Streamlit server, many users)
+_HTTP_POOL_CONNECTIONS = 4
+_HTTP_POOL_MAXSIZE = 16
+
 
 # =============================================================================
 # CACHED API KEY & HTTP SESSION
@@ -45,15 +74,30 @@ def _get_firebase_api_key() -> str:
     return st.secrets["firebase"]["apiKey"]
 
 
+@st.cache_data(ttl=3600)  # One formatted URL per endpoint (shares the key's lifetime)
+def _get_endpoint_url(action: str) -> str:
+    """Build the Identity Toolkit URL for an action like 'signUp' (cached)."""
+    return f"{_IDENTITY_TOOLKIT_URL}:{action}?key={_get_firebase_api_key()}"
+
+
 @st.cache_resource  # Singleton HTTP session for connection pooling
 def _get_http_session() -> requests.Session:
     """Get a reusable HTTP session for connection pooling."""
     session = requests.Session()
-    # Set default timeout and headers
+    # Keep TLS connections to Firebase open and shared across all user sessions
+    adapter = HTTPAdapter(pool_connections=_HTTP_POOL_CONNECTIONS, pool_maxsize=_HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    # Set default headers (timeouts are passed per request)
     session.headers.update({"Content-Type": "application/json"})
     return session
 
 
+@st.cache_resource  # One worker pool shared by all sessions
+def _get_executor() -> ThreadPoolExecutor:
+    """Get a thread pool for running independent network calls side by side."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # TODO: Move these to utils/auth.py for better organization
@@ -70,14 +114,13 @@ def login_user(email: str, password: str) -> dict:
         dict: Firebase response JSON. On success includes 'idToken', 'localId',
               'refreshToken'. On failure includes 'error' details.
     """
-    api_key = _get_firebase_api_key()
-    url = f"https://identitytoolkit.googleapis.com/v1/accounts:signInWithPassword?key={api_key}"
+    url = _get_endpoint_url("signInWithPassword")
     payload = {
         "email": email,
         "password": password,
         "returnSecureToken": True,
     }
-    resp = _get_http_session().post(url, json=payload, timeout=10)
+    resp = _get_http_session().post(url, json=payload, timeout=HTTP_TIMEOUT)
     return resp.json()
 
 
@@ -93,14 +136,13 @@ def signup_user(email: str, password: str) -> dict:
         dict: Firebase response JSON. On success includes 'idToken', 'localId',
               'refreshToken'. On failure includes 'error' details.
     """
-    api_key = _get_firebase_api_key()
-    url = f"https://identitytoolkit.googleapis.com/v1/accounts:signUp?key={api_key}"
+    url = _get_endpoint_url("signUp")
     payload = {
         "email": email,
         "password": password,
         "returnSecureToken": True,
     }
-    resp = _get_http_session().post(url, json=payload, timeout=10)
+    resp = _get_http_session().post(url, json=payload, timeout=HTTP_TIMEOUT)
     return resp.json()
 
 def send_verification_email(id_token: str) -> dict:
@@ -114,15 +156,14 @@ def send_verification_email(id_token: str) -> dict:
         dict: {"email": "..."} on success, {"error": "..."} on failure
     """
     try:
-        api_key = _get_firebase_api_key()
+        url = _get_endpoint_url("sendOobCode")
     except KeyError:
         return {"error": "Firebase API key not configured in secrets"}
     
-    url = f"https://identitytoolkit.googleapis.com/v1/accounts:sendOobCode?key={api_key}"
     payload = {"requestType": "VERIFY_EMAIL", "idToken": id_token}
     
     try:
-        resp = _get_http_session().post(url, json=payload, timeout=10)
+        resp = _get_http_session().post(url, json=payload, timeout=HTTP_TIMEOUT)
         resp.raise_for_status()
         return resp.json()
     except requests.exceptions.Timeout:
@@ -133,56 +174,62 @@ def send_verification_email(id_token: str) -> dict:
         return {"error": "Failed to send verification email"}
 
 
-def get_account_info(id_token: str) -> dict:
+def refresh_id_token(refresh_token: str) -> dict:
     """
-    Retrieve account info from Firebase for the given ID token.
+    Exchange a refresh token for a new ID token.
+    
+    The new token's claims are current, so e.g. its 'email_verified' claim
+    shows whether the user has clicked the verification link since logging in.
     
     Args:
-        id_token: The user's Firebase ID token
+        refresh_token: The user's Firebase refresh token (from login/signup response)
     
     Returns:
-        dict: {"users": [...]} on success, {"error": "..."} on failure
+        dict: {"idToken": "...", "refreshToken": "..."} on success,
+              {"error": "..."} on failure
     """
     try:
-        api_key = _get_firebase_api_key()
+        url = f"{_SECURE_TOKEN_URL}?key={_get_firebase_api_key()}"
     except KeyError:
         return {"error": "Firebase API key not configured in secrets"}
     
-    url = f"https://identitytoolkit.googleapis.com/v1/accounts:lookup?key={api_key}"
-    payload = {"idToken": id_token}
+    payload = {"grant_type": "refresh_token", "refresh_token": refresh_token}
     
     try:
-        resp = _get_http_session().post(url, json=payload, timeout=10)
+        resp = _get_http_session().post(url, json=payload, timeout=HTTP_TIMEOUT)
         resp.raise_for_status()
-        return resp.json()
+        data = resp.json()
+        return {"idToken": data["id_token"], "refreshToken": data["refresh_token"]}
     except requests.exceptions.Timeout:
         return {"error": "Request timed out. Please try again."}
     except requests.exceptions.RequestException as e:
         return {"error": f"Network error: {str(e)}"}
     except Exception:
-        return {"error": "Failed to retrieve account info"}
+        return {"error": "Failed to refresh sign-in"}
 
 
-def is_email_verified(id_token: str) -> tuple[bool, str | None]:
+def read_token_claims(id_token: str) -> dict:
     """
-    Check if the user's email is verified.
+    Read the claims (user info) stored inside a Firebase ID token.
+    
+    An ID token is a JWT: three base64url parts "header.claims.signature".
+    The signature is NOT checked here, so only use this on a token that came
+    straight from Firebase's HTTPS response (e.g. login_user() or
+    refresh_id_token()), never on a token supplied by the browser.
     
     Args:
         id_token: The user's Firebase ID token
     
     Returns:
-        tuple: (is_verified: bool, error_message: str | None)
+        dict: The token claims (e.g. 'email', 'email_verified'), or {} if
+              the token can't be read
     """
-    acct = get_account_info(id_token)
-    
-    if acct.get("error"):
-        return False, acct["error"]
-    
-    users = acct.get("users", [])
-    if not users:
-        return False, "Failed to retrieve account info"
-    
-    return users[0].get("emailVerified", False), None
+    try:
+        claims = id_token.split(".")[1]
+        claims += "=" * (-len(claims) % 4)  # Restore the stripped base64 padding
+        return json.loads(base64.urlsafe_b64decode(claims))
+    except (IndexError, ValueError):
+        return {}
 
 
 def is_valid_email(email: str) -> bool:
@@ -237,19 +284,24 @@ def create_user_settings(email: str, password: str) -> dict:
     }
 
 
-def complete_login(user_data: dict) -> None:
+def complete_login(user_data: dict, settings: dict | None = None) -> None:
     """
-    Complete the login process by setting session state and redirecting.
+    Complete the login process by setting session state.
+    
+    No rerun is needed: show_auth_page() sees the logged-in user, clears the
+    login UI, and lets the calling page carry on in the same run.
     
     Args:
         user_data: The Firebase user data (must contain 'localId' and 'idToken')
+        settings: The user's settings if already loaded (fetched when omitted)
     """
+    if settings is None:
+        settings = db.get_user_settings(user_data["localId"])
     st.session_state.user = user_data
-    st.session_state.settings = db.get_user_settings(user_data["localId"])
+    st.session_state.settings = settings
     # Clear any pending verification states
     st.session_state.pending_verification = None
     st.session_state.unverified_login = None
-    st.rerun()
 
 
 def clear_verification_states() -> None:
@@ -281,7 +333,7 @@ def render_verification_section(verification_data: dict, section_key: str) -> No
     Render the email verification UI section.
     
     Args:
-        verification_data: Dict containing 'idToken' and 'localId'
+        verification_data: Dict containing 'idToken', 'refreshToken' and 'localId'
         section_key: Unique key prefix for buttons (e.g., 'login', 'signup')
     """
     st.divider()
@@ -301,14 +353,16 @@ def render_verification_section(verification_data: dict, section_key: str) -> No
     
     with col2:
         if st.button("✓ I've verified — continue", key=f"check_{section_key}"):
+            # The old token predates the verification, so get a fresh one
+            # and read its email_verified claim
             with st.spinner("Checking..."):
-                verified, error = is_email_verified(verification_data["idToken"])
+                tokens = refresh_id_token(verification_data["refreshToken"])
             
-            if error:
-                st.error(error)
-            elif verified:
+            if tokens.get("error"):
+                st.error(tokens["error"])
+            elif read_token_claims(tokens["idToken"]).get("email_verified", False):
                 st.success("✅ Email verified! Signing you in...")
-                complete_login(verification_data)
+                complete_login({**verification_data, **tokens})
             else:
                 st.warning("⚠️ Email not yet verified. Please click the link in the email.")
     
@@ -342,30 +396,28 @@ def handle_login(email: str, password: str) -> None:
         message = error.get("message", "An error occurred") if isinstance(error, dict) else str(error)
         
         # Make common errors more user-friendly
-        friendly_messages = {
-            "EMAIL_NOT_FOUND": "No account found with this email address",
-            "INVALID_PASSWORD": "Incorrect password",
-            "INVALID_LOGIN_CREDENTIALS": "Invalid email or password",
-            "USER_DISABLED": "This account has been disabled",
-            "TOO_MANY_ATTEMPTS_TRY_LATER": "Too many failed attempts. Please try again later",
-        }
-        st.error(friendly_messages.get(message, message))
+        st.error(_LOGIN_ERROR_MESSAGES.get(message, message))
         return
     
-    # Check email verification status
-    verified, error = is_email_verified(result["idToken"])
-    
-    if error:
-        st.error(error)
-        return
+    # The token was just issued by Firebase, so its email_verified claim is
+    # current - no extra account lookup round-trip is needed
+    verified = read_token_claims(result["idToken"]).get("email_verified", False)
     
     if verified:
         st.success("✅ Login successful!")
-        complete_login(result)
+        # Fetch the settings and this month's data in one Firestore read;
+        # main.py picks up the month from preloaded_month instead of loading it.
+        # "This month" uses the browser's timezone, exactly like main.py's date
+        # picker, so the two month keys match.
+        month_key = datetime.datetime.now(ZoneInfo(st.context.timezone)).strftime("%Y-%m")
+        settings, *month_data = db.load_initial_state(result["localId"], month_key)
+        st.session_state.preloaded_month = (month_key, tuple(month_data))
+        complete_login(result, settings)
     else:
         st.warning("⚠️ Please verify your email before logging in.")
         st.session_state.unverified_login = {
             "idToken": result["idToken"],
+            "refreshToken": result["refreshToken"],
             "localId": result["localId"],
         }
         st.rerun()
@@ -392,26 +444,22 @@ def handle_signup(email: str, password: str) -> None:
     if "idToken" not in result:
         error = result.get("error", {})
         message = error.get("message", "An error occurred") if isinstance(error, dict) else str(error)
-        
-        friendly_messages = {
-            "EMAIL_EXISTS": "An account with this email already exists",
-            "WEAK_PASSWORD": f"Password must be at least {MIN_PASSWORD_LENGTH} characters",
-            "INVALID_EMAIL": "Please enter a valid email address",
-            "OPERATION_NOT_ALLOWED": "Email/password signup is disabled",
-        }
-        st.error(friendly_messages.get(message, message))
+        st.error(_SIGNUP_ERROR_MESSAGES.get(message, message))
         return
     
     st.success("🎉 Account created successfully!")
     
-    # Create user settings in database
+    # Create user settings in database and send the verification email.
+    # Neither call needs the other's result, so both run at the same time.
+    # (Only plain functions run in the threads - st.* calls stay out here.)
     settings_data = create_user_settings(email.strip(), password)
-    db.update_user_settings(result["localId"], settings_data)
-    st.session_state.settings = settings_data
-    
-    # Send verification email
     with st.spinner("Sending verification email..."):
-        send_resp = send_verification_email(result["idToken"])
+        executor = _get_executor()
+        settings_future = executor.submit(db.update_user_settings, result["localId"], settings_data)
+        email_future = executor.submit(send_verification_email, result["idToken"])
+        send_resp = email_future.result()
+        settings_future.result()  # Re-raises here if the Firestore write failed
+    st.session_state.settings = settings_data
     
     if send_resp.get("error"):
         st.error(f"Could not send verification email: {send_resp['error']}")
@@ -422,6 +470,7 @@ def handle_signup(email: str, password: str) -> None:
     # Store for verification flow
     st.session_state.pending_verification = {
         "idToken": result["idToken"],
+        "refreshToken": result["refreshToken"],
         "localId": result["localId"],
     }
     st.rerun()
@@ -498,6 +547,8 @@ def show_auth_page() -> None:
     Display the authentication page.
     
     This function can be called from streamlit_app.py to show the auth UI.
+    It stops the script until the user is logged in. A successful login
+    clears the auth UI and returns, so the page continues in the same run.
     """
     init_session_state()
     
@@ -505,17 +556,33 @@ def show_auth_page() -> None:
     if "user" in st.session_state and st.session_state.user:
         return
     st.set_page_config(page_title="DayMark - Login", layout="centered")
+    
+    # Everything is drawn in one placeholder so it can be removed on login
+    auth_page = st.empty()
+    with auth_page.container():
+        render_auth_form()
+    
+    if st.session_state.get("user"):
+        auth_page.empty()
+        return
+    
+    # Stop execution here - don't let the rest of main.py run
+    st.stop()
+
+
+def render_auth_form() -> None:
+    """Render the login/signup form (or the email verification step)."""
     st.title("Welcome to DayMark!")
     st.subheader("🔐 Sign in to continue")
     
     # Check for pending verification states BEFORE showing the form
     if st.session_state.unverified_login:
         render_verification_section(st.session_state.unverified_login, "login")
-        st.stop()
+        return
     
     if st.session_state.pending_verification:
         render_verification_section(st.session_state.pending_verification, "signup")
-        st.stop()
+        return
     
     # Auth mode selection
     mode = st.radio(
@@ -560,9 +627,6 @@ def show_auth_page() -> None:
     # Footer links (optional - for terms, privacy, etc.)
     st.divider()
     st.caption("By continuing, you agree to our Terms of Service and Privacy Policy.")
-    
-    # Stop execution here - don't let the rest of main.py run
-    st.stop()
 
 
 # =============================================================================
@@ -570,6 +634,6 @@ def show_auth_page() -> None:
 # =============================================================================
 
 # Run the auth page when this file is executed directly or imported as a page
+# (show_auth_page() stops the script itself until the user is logged in)
 if __name__ == "__main__" or "user" not in st.session_state:
     show_auth_page()
-    st.stop()
@@ -0,0 +1,107 @@
+# ============================================================================
+# STATIC PAGE CONTENT MODULE
+# ============================================================================
+# This file loads the static copy (Markdown) used by the info pages like
+# "How DayMark Works" and "About DayMark".
+#
+# WHERE THE CONTENT LIVES:
+# content/
+#   ├── how_it_works/   ← One .md file per section of the guide
+#   ├── intro/          ← Landing page cards, sections, and FAQ answers
+#   └── about/          ← Longer sections of the About page
+#
+# RENDERING:
+# Pages describe their sections as data and call render_sections(),
+# render_card_grid() or render_page_links(), so every info page shares the
+# same layout code.
+#
+# CACHING:
+# The files never change while the app is running, so each one is read from
+# disk once and then served from Streamlit's cache on every rerun.
+# ============================================================================
+
+from pathlib import Path
+
+import streamlit as st
+
+
+# Root folder for all Markdown content (next to the page scripts)
+CONTENT_DIR = Path(__file__).resolve().parent.parent / "content"
+
+
+@st.cache_data(show_spinner=False)  # Read each file only once per process
+def load_markdown(name):
+    """
+    Load a Markdown file from the content folder.
+
+    Args:
+        name (str): Path inside content/ without the extension,
+                    e.g. "how_it_works/habits"
+
+    Returns:
+        str: The file's Markdown text
+    """
+    return (CONTENT_DIR / f"{name}.md").read_text(encoding="utf-8")
+
+
+# ----------------------------------------------------------------------------
+# SHARED PAGE BUILDING BLOCKS
+# ----------------------------------------------------------------------------
+
+def render_sections(sections):
+    """
+    Render a list of bordered content sections.
+
+    Args:
+        sections (list): (header, content_name, callout) tuples where
+            content_name is passed to load_markdown() and callout is either
+            None or a (kind, text) pair such as ("info", "💡 **Tip:** ...").
+            kind is the Streamlit function used: "info", "warning", "caption".
+
+    Example:
+        render_sections([
+            ("1) 📊 Habits", "how_it_works/habits", ("info", "Start small.")),
+        ])
+    """
+    for header, content_name, callout in sections:
+        st.header(header)
+        with st.container(border=True):
+            st.markdown(load_markdown(content_name))
+            if callout:
+                kind, text = callout
+                getattr(st, kind)(text)
+
+
+def render_card_grid(columns):
+    """
+    Render bordered Markdown cards laid out in columns.
+
+    The last card in each column stretches to the row height, so the
+    columns line up at the bottom.
+
+    Args:
+        columns (list): One list of content names per column, e.g.
+            [["intro/progress", "intro/journal"], ["intro/patterns"]]
+    """
+    for col, cards in zip(st.columns(len(columns)), columns):
+        with col:
+            for i, content_name in enumerate(cards):
+                stretch = i == len(cards) - 1
+                with st.container(border=True, height='stretch' if stretch else 'content'):
+                    st.markdown(load_markdown(content_name))
+
+
+def render_page_links(links):
+    """
+    Render a row of navigation links (e.g. the footer of info pages).
+
+    st.page_link navigates straight to the page registered in
+    st.navigation, without the extra rerun a button + st.switch_page needs.
+
+    Args:
+        links (list): (label, page_path) pairs, one column each,
+                      e.g. [("Open DayMark", "main.py")]
+    """
+    for col, (label, page) in zip(st.columns(len(links)), links):
+        with col:
+            st.page_link(page, label=label, width='stretch')
@@ -19,12 +19,17 @@
 #           └── tasks                 ← Tasks for each day
 #
 # CACHING:
-# We use @st.cache_resource to avoid reinitializing Firebase on every rerun.
+# We use @st.cache_resource to avoid recreating the Firestore client on every rerun.
+# User settings and month data are cached with @st.cache_data (each entry is
+# cleared whenever it's saved), so switching back to a month is instant.
 # This makes the app much faster!
 # ============================================================================
 
-import firebase_admin
-from firebase_admin import credentials, firestore
+import copy
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from google.cloud import firestore
+from google.oauth2 import service_account
 import streamlit as st
 
 
@@ -35,12 +40,18 @@ import streamlit as st
 @st.cache_resource  # Cache this so it only runs once (not on every rerun)
 def get_db():
     """
-    Initialize Firebase and return a Firestore database client.
+    Create and return a Firestore database client.
     
     This function:
-    1. Loads credentials from Streamlit secrets
-    2. Initializes the Firebase app
-    3. Returns a Firestore client for database operations
+    1. Loads the service account credentials from Streamlit secrets
+    2. Returns a Firestore client for database operations
+    
+    We only ever read and write documents, so the client is created directly
+    from google-cloud-firestore (the Firebase Admin SDK's app registry and
+    auth features aren't needed - login uses the Firebase Auth REST API).
+    
+    Cached with @st.cache_resource, so every session and every db function
+    shares one client (and its gRPC connection).
     
     Returns:
         google.cloud.firestore.Client: The Firestore database client
@@ -48,15 +59,16 @@ def get_db():
     # Load the service account credentials from secrets
     # (These are stored in .streamlit/secrets.toml)
     key_dict = dict(st.secrets["service_account"])
-    
-    # Create a Certificate object from the credentials
-    cred = credentials.Certificate(key_dict)
-    
-    # Initialize the Firebase Admin SDK
-    firebase_admin.initialize_app(cred)
+    cred = service_account.Credentials.from_service_account_info(key_dict)
     
     # Return the Firestore client (this is what we use to read/write data)
-    return firestore.client()
+    return firestore.Client(project=cred.project_id, credentials=cred)
+
+
+@st.cache_resource  # One small pool shared by every session
+def _get_background_executor():
+    """Thread pool used for background (auto)saves and month prefetching."""
+    return ThreadPoolExecutor(max_workers=4)
 
 
 # ----------------------------------------------------------------------------
@@ -65,10 +77,14 @@ def get_db():
 # These functions handle the user's profile settings (name, email, etc.)
 # Settings are stored at: users/{uid}/settings/profile
 
+@st.cache_data(ttl=3600, show_spinner=False)  # One cached copy per uid
 def get_user_settings(uid):
     """
     Load a user's settings from the database.
     
+    Cached for an hour per user; update_user_settings() clears the entry
+    so a save is never followed by a stale read.
+    
     Args:
         uid (str): The user's unique Firebase ID
     
@@ -103,6 +119,9 @@ def update_user_settings(uid, settings_data):
         settings_data, 
         merge=True
     )
+    
+    # Drop this user's cached settings so the next read sees the new values
+    get_user_settings.clear(uid)
 
 
 # ----------------------------------------------------------------------------
@@ -112,13 +131,17 @@ def update_user_settings(uid, settings_data):
 # We use a "local-first" approach:
 #   1. Load all data for a month into memory
 #   2. User edits happen in memory (fast!)
-#   3. Save everything back when user clicks "Save" or changes month
+#   3. Save the changed fields back when user clicks "Save" or changes month
 
+@st.cache_data(ttl=600, show_spinner=False)  # One cached copy per (uid, month)
 def load_month_data(uid, month_key):
     """
     Load all habits, journal entries, and tasks for a specific month.
     
     Uses batch get_all() for parallel fetching (single round-trip to Firestore).
+    Cached for ten minutes per (uid, month_key); save_month_changes() clears
+    the entry so a save is never followed by a stale read. Each call returns a
+    fresh copy, so editing the result never changes the cache.
     
     Args:
         uid (str): The user's unique Firebase ID
@@ -152,36 +175,157 @@ def load_month_data(uid, month_key):
     return results[0], results[1], results[2]
 
 
-def save_month_data(uid, month_key, habits_data, journal_data, tasks_data):
+def load_initial_state(uid, month_key):
     """
-    Save all habits, journal entries, and tasks for a specific month.
+    Load a user's settings and one month's data together, right after login.
     
-    Uses a Firestore "batch" to save all three documents in one operation.
-    This is faster and ensures all data is saved together (atomic write).
+    The settings document is fetched in the same get_all() as the month's
+    three documents, so the dashboard's first render needs one round-trip
+    instead of two.
     
     Args:
         uid (str): The user's unique Firebase ID
-        month_key (str): The month to save, formatted as "YYYY-MM"
-        habits_data (dict): All habits for the month
-        journal_data (dict): All journal entries for the month
-        tasks_data (dict): All tasks for the month
+        month_key (str): The month to load, formatted as "YYYY-MM"
+    
+    Returns:
+        tuple: (settings_dict, habits_dict, journal_dict, tasks_dict),
+               each an empty dict if the document doesn't exist
     """
     db = get_db()
     
-    # Create a batch - this lets us write multiple documents at once
+    user_ref = db.collection('users').document(uid)
+    user_month_ref = user_ref.collection(month_key)
+    refs = [
+        user_ref.collection('settings').document('profile'),
+        user_month_ref.document('habits'),
+        user_month_ref.document('journal'),
+        user_month_ref.document('tasks'),
+    ]
+    
+    # Fetch all four documents in a single round-trip (same order as refs)
+    docs = db.get_all(refs)
+    settings, habits, journal, tasks = [doc.to_dict() if doc.exists else {} for doc in docs]
+    
+    return settings, habits, journal, tasks
+
+
+def prefetch_month_data(uid, month_keys):
+    """
+    Load months into the load_month_data() cache on a background thread.
+    
+    Used for the months next to the one being viewed, so switching to them
+    is served from the cache instead of waiting on Firestore.
+    
+    Args:
+        uid (str): The user's unique Firebase ID
+        month_keys (list): Months to load, formatted as "YYYY-MM"
+    """
+    executor = _get_background_executor()
+    for month_key in month_keys:
+        executor.submit(load_month_data, uid, month_key)
+
+
+def save_month_changes(uid, month_key, month_data, changed_fields):
+    """
+    Save only the fields that changed since the last save.
+    
+    Each document (habits, journal, tasks) is a map of top-level fields:
+    a habit name, or a day for journal/tasks. Instead of rewriting whole
+    documents, we send just the changed fields. Each listed field is
+    replaced completely (so removed tasks inside a day really disappear),
+    and a field that no longer exists in month_data is deleted.
+    
+    Args:
+        uid (str): The user's unique Firebase ID
+        month_key (str): The month to save, formatted as "YYYY-MM"
+        month_data (dict): {"habits": {...}, "journal": {...}, "tasks": {...}}
+        changed_fields (dict): Changed field names per document, e.g.
+            {"habits": {"Gym"}, "journal": {"21"}, "tasks": set()}
+    """
+    db = get_db()
     batch = db.batch()
+    user_month_ref = db.collection('users').document(uid).collection(month_key)
+    
+    for doc_name, fields in changed_fields.items():
+        if not fields:
+            continue
+        
+        doc_data = month_data[doc_name]
+        updates = {field: doc_data.get(field, firestore.DELETE_FIELD) for field in fields}
+        
+        # merge=[paths] writes only these fields; field_path() escapes names
+        # containing dots or other special characters (e.g. "Read 10 pages.")
+        batch.set(
+            user_month_ref.document(doc_name),
+            updates,
+            merge=[db.field_path(field) for field in fields]
+        )
+    
+    # All changed documents are written together in one round-trip
+    batch.commit()
+    
+    # Drop this month's cached copy so the next load sees the new values
+    load_month_data.clear(uid, month_key)
+
+
+def save_month_changes_in_background(uid, month_key, month_data, changed_fields) -> Future:
+    """
+    Start save_month_changes() on a background thread and return right away.
+    
+    The changed fields are copied first, so the user can keep editing
+    (the page mutates month_data in place) while the write is running.
+    
+    Args:
+        Same as save_month_changes()
+    
+    Returns:
+        concurrent.futures.Future: Finishes when the write is done; its
+        .exception() is set if the write failed
+    """
+    # Snapshot only what will be written (missing fields stay missing -> deleted)
+    snapshot = {
+        doc_name: {
+            field: copy.deepcopy(month_data[doc_name][field])
+            for field in fields
+            if field in month_data[doc_name]
+        }
+        for doc_name, fields in changed_fields.items()
+    }
+    fields = {doc_name: set(names) for doc_name, names in changed_fields.items()}
+    
+    return _get_background_executor().submit(save_month_changes, uid, month_key, snapshot, fields)
+
+
+def switch_month(uid, old_month_key, old_month_data, changed_fields, new_month_key):
+    """
+    Save the old month's changes and load the new month in parallel.
+    
+    The two months are separate documents, so the write (on a background
+    thread) and the read overlap instead of waiting for each other.
+    
+    Args:
+        uid (str): The user's unique Firebase ID
+        old_month_key (str | None): The month being left ("YYYY-MM")
+        old_month_data (dict): That month's {"habits", "journal", "tasks"}
+        changed_fields (dict): Its changed fields (see save_month_changes())
+        new_month_key (str): The month to load ("YYYY-MM")
+    
+    Returns:
+        tuple: (habits_dict, journal_dict, tasks_dict) for the new month
+    
+    Raises:
+        Exception: Whatever the save raised, so a failed save is not hidden
+    """
+    pending_save = None
+    if old_month_key and any(changed_fields.values()):
+        pending_save = save_month_changes_in_background(
+            uid, old_month_key, old_month_data, changed_fields
+        )
     
-    # Create references to where we'll save the data
-    habits_ref = db.collection('users').document(uid).collection(month_key).document('habits')
-    journal_ref = db.collection('users').document(uid).collection(month_key).document('journal')
-    tasks_ref = db.collection('users').document(uid).collection(month_key).document('tasks')
+    new_month = load_month_data(uid, new_month_key)
     
-    # Add each document to the batch
-    # We use set() without merge=True to completely overwrite the documents
-    # This ensures that deleted habits/tasks are actually removed
-    batch.set(habits_ref, habits_data)
-    batch.set(journal_ref, journal_data)
-    batch.set(tasks_ref, tasks_data)
+    # Wait for the save; .result() re-raises its error if it failed
+    if pending_save is not None:
+        pending_save.result()
     
-    # Execute all writes at once
-    batch.commit()
\ No newline at end of file
+    return new_month
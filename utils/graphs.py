@@ -9,23 +9,137 @@
 # 3. Individual Trends   → Line graph comparing selected habits over time
 #
 # LIBRARIES USED:
+# - NumPy: Counts completions with fast array operations
 # - Plotly: A powerful charting library that creates interactive graphs
-# - Streamlit's @st.cache_data: Caches results to avoid recalculating
+# - Streamlit's caching decorators: Cache results to avoid recalculating
 #
 # CACHING:
 # Charts are cached for 5 minutes. This means if you view the same data
 # multiple times, it won't recalculate - it just shows the cached result.
+# The finished figures use @st.cache_resource, which hands back the cached
+# object itself; @st.cache_data would unpickle (and so re-validate) a fresh
+# copy of the figure on every rerun. Nothing changes a figure once it's
+# built (st.plotly_chart only reads it), so sharing it is safe.
+#
+# The cache key for habits_data comes from _hash_habits(): one JSON dump
+# hashed in C is far quicker than Streamlit walking the nested dictionary
+# item by item, which matters because every rerun looks up all the charts.
 # ============================================================================
 
+import hashlib
+import json
+
+import numpy as np  # Fast array math for the score calculations
 import plotly.graph_objects as go  # Plotly for creating charts
 import streamlit as st  # For caching decorator
 
 
+MAX_DAYS_IN_MONTH = 31
+
+# Chart appearance for the daily score chart (built once, reused for every figure)
+DAILY_SCORE_LAYOUT = dict(
+    title='Total Daily Score (Habits Completed Per Day)',
+    xaxis_title='Day of Month',
+    yaxis_title='Number of Habits Completed',
+    hovermode='x unified',  # When hovering, show all values for that day
+    height=400              # Chart height in pixels
+)
+
+# Chart appearance for the habit consistency bar chart
+CONSISTENCY_LAYOUT = dict(
+    title='Habit Consistency - Who\'s the Winner?',
+    xaxis_title='Habits',
+    yaxis_title='Total Completions',
+    height=400,
+    showlegend=False        # No legend needed for bar chart
+)
+
+# Chart appearance for the individual trends chart
+TRENDS_LAYOUT = dict(
+    title='Individual Habit Trends - Daily Completion',
+    xaxis_title='Day of Month',
+    yaxis_title='Completed or Not',
+    hovermode='x unified',
+    height=400,
+    yaxis=dict(
+        tickvals=[0, 1],                # Only show 0 and 1 on Y-axis
+        ticktext=['Not Done', 'Done']   # Label them nicely
+    )
+)
+
+# Colors for each line in the trends chart (cycles if more than 7 habits)
+TREND_COLORS = ('#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2')
+#                blue       orange     green      red        purple     brown      pink
+
+
+# ----------------------------------------------------------------------------
+# SHARED HELPERS
+# ----------------------------------------------------------------------------
+
+def _hash_habits(habits_data):
+    """
+    Hash the habits dictionary for the cache keys (used via hash_funcs).
+    
+    Dictionary order is kept (not sorted) because the charts list habits in
+    that order, so a reordered dictionary must not reuse a cached chart.
+    Values JSON can't encode (e.g. NumPy bools from the data editor or
+    Firestore timestamps) are hashed by their repr() instead of failing.
+    
+    Args:
+        habits_data (dict): All habits data
+    
+    Returns:
+        bytes: A short digest of the data
+    """
+    return hashlib.blake2b(json.dumps(habits_data, default=repr).encode(), digest_size=16).digest()
+
+
+# Every cached function below hashes its habits dictionary with _hash_habits
+# (habits_data is the only dict argument any of them takes)
+_HASH_FUNCS = {dict: _hash_habits}
+
+
+@st.cache_data(ttl=300, hash_funcs=_HASH_FUNCS)  # Shared by all three charts, so the matrix is built once
+def _completion_matrix(habits_data):
+    """
+    Turn the habits dictionary into a (habits x days) 0/1 NumPy matrix.
+    
+    Every chart reads this same matrix: the daily score sums down columns,
+    consistency sums across rows, and the trends chart picks out rows.
+    
+    Args:
+        habits_data (dict): All habits data
+    
+    Returns:
+        tuple: (matrix, days) where matrix[row, day - 1] is 1 if the habit
+               in that row was done on that day, and days is the sorted list
+               of day numbers present in the data
+    """
+    # Row = habit (in dictionary order), column = day - 1 (a month has at most 31)
+    # uint8 = one byte per cell (50 habits x 31 days is ~1.5 KB)
+    matrix = np.zeros((len(habits_data), MAX_DAYS_IN_MONTH), dtype=np.uint8)
+    present_days = set()
+
+    # Single pass over every stored cell: note the day and mark completions
+    for row, days_dict in enumerate(habits_data.values()):
+        for day_str, done in days_dict.items():
+            day = int(day_str)
+            present_days.add(day)
+            if done:
+                matrix[row, day - 1] = 1
+
+    # Trim to the last day present (avoids plotting days the month doesn't have)
+    days = sorted(present_days)
+    matrix = matrix[:, :days[-1] if days else 0]
+
+    return matrix, days
+
+
 # ----------------------------------------------------------------------------
 # DAILY SCORE CALCULATION & CHART
 # ----------------------------------------------------------------------------
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes to avoid recalculating
+@st.cache_resource(ttl=300, hash_funcs=_HASH_FUNCS)  # Cache the figure for 5 minutes (returned without copying)
 def calculate_daily_score(habits_data):
     """
     Calculate how many habits were completed each day of the month.
@@ -38,34 +152,23 @@ def calculate_daily_score(habits_data):
         plotly.graph_objects.Figure: A line chart of daily scores
     
     Example:
-        If you have 3 habits and completed 2 on day 1, daily_scores["1"] = 2
+        If you have 3 habits and completed 2 on day 1, the score for day 1 is 2
     """
-    # Get all unique days from the data (avoids iterating 1-31 unnecessarily)
-    all_days = set()
-    for days_dict in habits_data.values():
-        all_days.update(days_dict.keys())
-    
-    daily_scores = {}
-    
-    # Only iterate over days that actually exist in the data
-    for day_str in all_days:
-        score = 0
-        # Check each habit to see if it was done on this day
-        for habit_name, days_dict in habits_data.items():
-            # If this day exists and the value is True, increment score
-            if days_dict.get(day_str):
-                score += 1
-        daily_scores[day_str] = score
+    matrix, days = _completion_matrix(habits_data)
+
+    # Summing down each column counts completed habits per day in one pass
+    scores = matrix.sum(axis=0, dtype=np.int32)
     
-    # Create and return the chart
-    return plot_daily_score(daily_scores)
+    # Create and return the chart (days are already sorted, so the
+    # lists go straight to Plotly without a day -> score dictionary)
+    return plot_daily_score(days, scores[np.asarray(days, dtype=np.intp) - 1].tolist())
 
 
 # ----------------------------------------------------------------------------
 # HABIT CONSISTENCY CALCULATION & CHART
 # ----------------------------------------------------------------------------
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_resource(ttl=300, hash_funcs=_HASH_FUNCS)  # Cache the figure for 5 minutes (returned without copying)
 def calculate_habit_consistency(habits_data):
     """
     Calculate how many times each habit was completed this month.
@@ -81,14 +184,11 @@ def calculate_habit_consistency(habits_data):
     Example:
         If "Gym" was True on 20 days, habit_totals["Gym"] = 20
     """
-    habit_totals = {}
-    
-    # Loop through each habit
-    for habit_name, days_dict in habits_data.items():
-        # Count how many True values (completed days) this habit has
-        # The 'if value' part filters to only True values
-        total = sum(1 for value in days_dict.values() if value)
-        habit_totals[habit_name] = total
+    matrix, _ = _completion_matrix(habits_data)
+
+    # Summing across each row counts the completed days per habit
+    totals = matrix.sum(axis=1, dtype=np.int32)
+    habit_totals = {habit_name: int(total) for habit_name, total in zip(habits_data, totals)}
     
     # Create and return the chart
     return plot_habit_consistency(habit_totals)
@@ -99,7 +199,7 @@ def calculate_habit_consistency(habits_data):
 # ----------------------------------------------------------------------------
 # These functions take calculated data and create Plotly figures.
 
-def plot_daily_score(daily_scores):
+def plot_daily_score(days, scores):
     """
     Create a LINE CHART showing daily habit completion scores.
     
@@ -109,36 +209,23 @@ def plot_daily_score(daily_scores):
     - Is there a trend over the month?
     
     Args:
-        daily_scores (dict): {"1": 3, "2": 2, "3": 4, ...} (day -> count)
+        days (list): Day numbers in order, e.g. [1, 2, 3, ...]
+        scores (list): Habits completed on each of those days, e.g. [3, 2, 4, ...]
     
     Returns:
         plotly.graph_objects.Figure: The line chart
     """
-    # Sort days numerically (keys are strings like "1", "2", ... "31")
-    sorted_days = sorted(daily_scores.keys(), key=lambda d: int(d))
-    days = sorted_days
-    scores = [daily_scores[d] for d in sorted_days]
-    
-    # Create an empty figure
-    fig = go.Figure()
-    
-    # Add a line trace (the actual line on the chart)
-    fig.add_trace(go.Scatter(
-        x=days,                          # X-axis: day numbers
-        y=scores,                        # Y-axis: scores
-        mode='lines+markers',            # Show both line and dots
-        name='Daily Score',              # Name shown in legend
-        line=dict(color='#1f77b4', width=2),  # Blue line, 2px thick
-        marker=dict(size=8)              # Dot size
-    ))
-    
-    # Customize the chart's appearance
-    fig.update_layout(
-        title='Total Daily Score (Habits Completed Per Day)',
-        xaxis_title='Day of Month',
-        yaxis_title='Number of Habits Completed',
-        hovermode='x unified',  # When hovering, show all values for that day
-        height=400              # Chart height in pixels
+    # Build the figure in one call with the shared layout (no update_layout merge)
+    fig = go.Figure(
+        data=[go.Scatter(
+            x=days,                          # X-axis: day numbers
+            y=scores,                        # Y-axis: scores
+            mode='lines+markers',            # Show both line and dots
+            name='Daily Score',              # Name shown in legend
+            line=dict(color='#1f77b4', width=2),  # Blue line, 2px thick
+            marker=dict(size=8)              # Dot size
+        )],
+        layout=DAILY_SCORE_LAYOUT
     )
     
     return fig
@@ -157,34 +244,27 @@ def plot_habit_consistency(habit_totals):
     Returns:
         plotly.graph_objects.Figure: The bar chart
     """
-    habits = list(habit_totals.keys())
-    totals = list(habit_totals.values())
-    
-    # Sort habits by total completions (highest first)
-    sorted_data = sorted(zip(habits, totals), key=lambda x: x[1], reverse=True)
-    habits, totals = zip(*sorted_data) if sorted_data else ([], [])
-    
-    fig = go.Figure()
-    
-    # Add bars
-    fig.add_trace(go.Bar(
-        x=habits,                        # X-axis: habit names
-        y=totals,                        # Y-axis: completion counts
-        marker=dict(
-            color=totals,                # Color intensity based on value
-            colorscale='viridis',        # Green → yellow → purple gradient
-            showscale=True               # Show the color legend
-        ),
-        text=totals,                     # Show numbers on top of bars
-        textposition='outside'           # Numbers appear above bars
-    ))
-    
-    fig.update_layout(
-        title='Habit Consistency - Who\'s the Winner?',
-        xaxis_title='Habits',
-        yaxis_title='Total Completions',
-        height=400,
-        showlegend=False                 # No legend needed for bar chart
+    names = np.array(list(habit_totals.keys()), dtype=object)
+    counts = np.fromiter(habit_totals.values(), dtype=np.int32, count=len(habit_totals))
+    
+    # Sort habits by total completions (highest first); stable keeps ties in order
+    order = np.argsort(-counts, kind='stable')
+    habits, totals = names[order].tolist(), counts[order].tolist()
+    
+    # Build the figure in one call (bars + layout validated together)
+    fig = go.Figure(
+        data=[go.Bar(
+            x=habits,                        # X-axis: habit names
+            y=totals,                        # Y-axis: completion counts
+            marker=dict(
+                color=totals,                # Color intensity based on value
+                colorscale='viridis',        # Green → yellow → purple gradient
+                showscale=True               # Show the color legend
+            ),
+            text=totals,                     # Show numbers on top of bars
+            textposition='outside'           # Numbers appear above bars
+        )],
+        layout=CONSISTENCY_LAYOUT
     )
     
     return fig
@@ -194,6 +274,7 @@ def plot_habit_consistency(habit_totals):
 # INDIVIDUAL HABIT TRENDS CHART
 # ----------------------------------------------------------------------------
 
+@st.cache_resource(ttl=300, hash_funcs=_HASH_FUNCS)  # Cache the figure for 5 minutes (keyed on data + selection)
 def plot_individual_trends(habits_data, selected_habits):
     """
     Create a LINE CHART comparing specific habits over time.
@@ -208,42 +289,37 @@ def plot_individual_trends(habits_data, selected_habits):
     Returns:
         plotly.graph_objects.Figure: The comparison line chart
     """
-    fig = go.Figure()
+    # Nothing picked yet (the usual case when the tab opens): just the empty chart
+    if not selected_habits:
+        return go.Figure(layout=TRENDS_LAYOUT)
     
-    # Define colors for each line (cycles if more than 5 habits)
-    colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd', '#8c564b', '#e377c2']
-    #          blue         orange          green       red         purple          brown        pink
+    # Reuse the cached matrix: each habit's line is one row, already 1/0
+    matrix, _ = _completion_matrix(habits_data)
+    row_of = {habit_name: row for row, habit_name in enumerate(habits_data)}
     
-    # Add a line for each selected habit
+    # Collect a line for each selected habit, then build the figure once
+    traces = []
     for idx, habit_name in enumerate(selected_habits):
-        days_dict = habits_data.get(habit_name, {})
+        # Plot only the days this habit has stored (a habit missing from
+        # the data still gets its legend entry, just with no points)
+        days = sorted(map(int, habits_data.get(habit_name, {})))
         
-        # Get sorted day numbers and convert True/False to 1/0
-        days = sorted([int(d) for d in days_dict.keys()])
-        values = [1 if days_dict[str(d)] else 0 for d in days]
+        # The 0/1 values go to Plotly as a NumPy array, which it sends to the
+        # browser as a compact typed array instead of a list of numbers
+        values = matrix[row_of[habit_name], np.asarray(days, dtype=np.intp) - 1] if days else []
         
         # Add this habit's line to the chart
-        fig.add_trace(go.Scatter(
+        traces.append(go.Scatter(
             x=days,
             y=values,
             mode='lines+markers',
             name=habit_name,                              # Shows in legend
-            line=dict(color=colors[idx % len(colors)], width=2),
+            line=dict(color=TREND_COLORS[idx % len(TREND_COLORS)], width=2),
             marker=dict(size=6)
         ))
     
-    # Customize the chart
-    fig.update_layout(
-        title='Individual Habit Trends - Daily Completion',
-        xaxis_title='Day of Month',
-        yaxis_title='Completed or Not',
-        hovermode='x unified',
-        height=400,
-        yaxis=dict(
-            tickvals=[0, 1],                # Only show 0 and 1 on Y-axis
-            ticktext=['Not Done', 'Done']   # Label them nicely
-        )
-    )
+    # Create the chart with the shared layout in a single call
+    fig = go.Figure(data=traces, layout=TRENDS_LAYOUT)
     
     return fig
 